@@ -3,6 +3,7 @@ import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, BRAND
 
@@ -62,6 +63,12 @@ class NikobusButtonBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_name = f"Nikobus Sensor {address}"
         self._attr_unique_id = f"{DOMAIN}_{address}"
         self._attr_device_class = "push"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, address)},
+            name=description,
+            manufacturer=BRAND,
+            model="Push Button",
+        )
 
     @callback
     async def handle_button_press_event(self, event):
@@ -81,16 +88,6 @@ class NikobusButtonBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Return True if the button is pressed, else False."""
         return self._state
 
-    @property
-    def device_info(self):
-        """Return device information about this binary sensor."""
-        return {
-            "identifiers": {(DOMAIN, self._address)},
-            "name": self._description,
-            "manufacturer": BRAND,
-            "model": "Push Button",
-        }
-
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
         """Return extra state attributes of the binary sensor."""
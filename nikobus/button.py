@@ -2,6 +2,7 @@
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, BRAND
 
@@ -9,28 +10,23 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> b
     """Set up Nikobus button entities from a config entry."""
     dataservice = hass.data[DOMAIN].get(entry.entry_id)
 
-    entities = []
-
     # If the PyPI library provides an API method to fetch button data, replace `dict_button_data` with it
-    if dataservice.api.dict_button_data:
-        for button in dataservice.api.dict_button_data.get("nikobus_button", {}).values():
-            impacted_modules_info = [
+    buttons = dataservice.api.dict_button_data.get("nikobus_button", {}) if dataservice.api.dict_button_data else {}
+
+    async_add_entities(
+        NikobusButtonEntity(
+            hass,
+            dataservice,
+            button.get("description"),
+            button.get("address"),
+            button.get("operation_time"),
+            [
                 {"address": impacted_module["address"], "group": impacted_module["group"]}
                 for impacted_module in button.get("impacted_module", [])
-            ]
-
-            entity = NikobusButtonEntity(
-                hass,
-                dataservice,
-                button.get("description"),
-                button.get("address"),
-                button.get("operation_time"),
-                impacted_modules_info,
-            )
-
-            entities.append(entity)
-
-    async_add_entities(entities)
+            ],
+        )
+        for button in buttons.values()
+    )
 
 class NikobusButtonEntity(CoordinatorEntity, ButtonEntity):
     """Representation of a Nikobus button entity within Home Assistant."""
@@ -47,24 +43,18 @@ class NikobusButtonEntity(CoordinatorEntity, ButtonEntity):
 
         self._attr_name = f"Nikobus Push Button {address}"
         self._attr_unique_id = f"{DOMAIN}_{address}"
-
-    @property
-    def device_info(self):
-        """Return device information about this button entity."""
-        return {
-            "identifiers": {(DOMAIN, self._address)},
-            "name": self._description,
-            "manufacturer": BRAND,
-            "model": "Push Button",
-        }
-
-    @property
-    def extra_state_attributes(self) -> dict[str, str] | None:
-        """Return extra state attributes of the button entity."""
-        impacted_modules_str = ", ".join(
-            f"{module['address']}_{module['group']}" for module in self.impacted_modules_info
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, address)},
+            name=description,
+            manufacturer=BRAND,
+            model="Push Button",
         )
-        return {"impacted_modules": impacted_modules_str}
+        # The impacted modules do not change after setup, build the attributes once
+        self._attr_extra_state_attributes = {
+            "impacted_modules": ", ".join(
+                f"{module['address']}_{module['group']}" for module in impacted_modules_info
+            )
+        }
 
     async def async_press(self) -> None:
         """Handle button press."""
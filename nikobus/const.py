@@ -1,6 +1,8 @@
 """Constants"""
-DOMAIN = "nikobus"
-BRAND = "Niko"
+from typing import Final
+
+DOMAIN: Final = "nikobus"
+BRAND: Final = "Niko"
 
 # Configuration
 CONF_CONNECTION_STRING = "connection_string"
@@ -8,6 +10,9 @@ CONF_REFRESH_INTERVAL = "refresh_interval"
 CONF_HAS_FEEDBACK_MODULE = "has_feedback_module"
 CONF_HAS_PC_LINK = "has_pc_link"
 
+# Channels
+CHANNEL_NOT_IN_USE = "not_in_use" # Channels whose description starts with this marker are not exposed as entities
+
 # Buttons
 DIMMER_DELAY = 1 # When a dimmer button is pressed, pause for DIMMER_DELAY before to retrieve status from NIkobus
 LONG_PRESS_THRESHOLD_MS = 500 # Time in ms to detect a long press (>= LONG_PRESS_THRESHOLD_MS)
@@ -27,8 +32,14 @@ MANUAL_REFRESH_COMMAND = ('$0512', '$0517') # Receiving refresh command result a
 COMMAND_PROCESSED = ('$0515', '$0516') # Confirms the command has been received and executed
 CONTROLLER_ADDRESS = '$18' # Prefix the Nikobus PC-Link address following an '#A' request
 
+# Dispatcher signals
+SIGNAL_BUTTON_PRESSED = 'nikobus_button_pressed_{}' # Fired per impacted module address when a Nikobus button is pressed
+SIGNAL_MODULE_REFRESHED = 'nikobus_refresh_{}' # Fired per module address when feedback data updated its state
+
 # Command
 COMMAND_EXECUTION_DELAY = 0.7  # Delay between command executions in seconds
 COMMAND_ACK_WAIT_TIMEOUT = 15  # Timeout for waiting for command ACK in seconds
 COMMAND_ANSWER_WAIT_TIMEOUT = 5  # Timeout for waiting for command answer in each loop
 MAX_ATTEMPTS = 3  # Maximum attempts for sending commands and waiting for an answer
+OUTPUT_COMMAND_QUEUE_SIZE = 64  # Maximum number of output state commands waiting to be sent
+REFRESH_MAX_CONCURRENT_QUERIES = 4  # Maximum number of module group state queries in flight during a refresh
@@ -4,6 +4,7 @@ import logging
 from datetime import timedelta
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.config_entries import ConfigEntry
 
@@ -12,7 +13,9 @@ from nikobusconnect import Nikobus, NikobusConnectionError, NikobusDataError
 from .const import (
     CONF_CONNECTION_STRING,
     CONF_REFRESH_INTERVAL,
-    CONF_HAS_FEEDBACK_MODULE
+    CONF_HAS_FEEDBACK_MODULE,
+    CHANNEL_NOT_IN_USE,
+    SIGNAL_BUTTON_PRESSED,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,8 +41,28 @@ class NikobusDataCoordinator(DataUpdateCoordinator):
             name="Nikobus",
             update_method=self.async_update_data,
             update_interval=update_interval,
+            # Listeners are only notified when a refresh returns different states
+            always_update=False,
         )
         self._unsub_update_listener = None
+        self._switch_channels = ()
+
+    @property
+    def switch_channels(self) -> tuple:
+        """Return the in-use switch channels as (description, model, address, channel, channel_description) rows."""
+        return self._switch_channels
+
+    def _build_switch_channels(self) -> tuple:
+        """Walk the switch module configuration once, skipping unused channels."""
+        rows = []
+        for address, switch_data in self.api.dict_module_data.get('switch_module', {}).items():
+            description = switch_data.get("description")
+            model = switch_data.get("model")
+            for i, channel in enumerate(switch_data.get("channels", []), start=1):
+                channel_description = channel.get("description")
+                if not (channel_description or "").startswith(CHANNEL_NOT_IN_USE):
+                    rows.append((description, model, address, i, channel_description))
+        return tuple(rows)
 
     async def async_config_entry_first_refresh(self):
         """Handle the first data refresh and set up the update listener."""
@@ -49,24 +72,46 @@ class NikobusDataCoordinator(DataUpdateCoordinator):
     async def connect(self):
         """Connect to the Nikobus system using the nikobusconnect library."""
         try:
+            # A reconnect replaces the previous instance, stop its command worker first
+            if self.api is not None:
+                await self.api.async_shutdown()
             # Initialize Nikobus instance from the PyPI library
             self.api = await Nikobus.create(self.hass, self._config_entry, self.connection_string, self.async_event_handler)
+            self._switch_channels = self._build_switch_channels()
             self.hass.async_create_task(self.api.command_handler())
             self.hass.async_create_task(self.api.listen_for_events())
             await self.async_refresh()
-        except  as e:
+        except NikobusConnectionError as e:
             _LOGGER.error("Failed to connect to Nikobus: %s", e)
             raise NikobusConnectError("Failed to connect to Nikobus.", original_exception=e)
 
+    async def async_shutdown(self) -> None:
+        """Stop refreshing and release the Nikobus connection resources."""
+        await super().async_shutdown()
+        if self._unsub_update_listener is not None:
+            self._unsub_update_listener()
+            self._unsub_update_listener = None
+        if self.api is not None:
+            await self.api.async_shutdown()
+
     async def async_update_data(self):
         """Fetch the latest data from the Nikobus system."""
         try:
             _LOGGER.debug("Refreshing Nikobus data")
-            return await self.api.refresh_nikobus_data()
+            await self.api.refresh_nikobus_data()
+            return self._snapshot_states()
         except NikobusDataError as e:
             _LOGGER.error("Error fetching Nikobus data: %s", e)
             raise UpdateFailed(f"Error fetching Nikobus data: {e}")
 
+    def _snapshot_states(self) -> dict:
+        """Return the cached output states exposed to entities as coordinator data."""
+        return {
+            **self.api.get_all_cover_states(),
+            **self.api.get_all_switch_states(),
+            **self.api.get_all_light_states(),
+        }
+
     async def async_event_handler(self, event, data):
         """Handle events received from the Nikobus system."""
         address = data.get('address')
@@ -74,20 +119,20 @@ class NikobusDataCoordinator(DataUpdateCoordinator):
         impacted_module_address = data.get('impacted_module_address')
 
         if event == "ha_button_pressed":
-            _LOGGER.debug(f"HA Button {address} pressed with operation_time: {operation_time}")
+            _LOGGER.debug("HA Button %s pressed with operation_time: %s", address, operation_time)
             await self.api.nikobus_command_handler.queue_command(f'#N{address}\r#E1')
 
         elif event == "nikobus_button_pressed":
-            _LOGGER.debug(f"Nikobus button pressed at address {address}, operation_time: {operation_time}, impacted_module_address: {impacted_module_address}")
+            _LOGGER.debug("Nikobus button pressed at address %s, operation_time: %s, impacted_module_address: %s", address, operation_time, impacted_module_address)
             self.hass.bus.async_fire('nikobus_button_pressed', {
                 'address': address,
                 'operation_time': operation_time,
                 'impacted_module_address': impacted_module_address
             })
-        elif event == 'nikobus_refreshed':
-            _LOGGER.debug(f"Nikobus has been refreshed for module {impacted_module_address}")
-
-        self.async_update_listeners()
+            # Button presses do not change the cached module states, so no coordinator snapshot is pushed:
+            # only the entities of the impacted module are woken to re-read their state
+            if impacted_module_address:
+                async_dispatcher_send(self.hass, SIGNAL_BUTTON_PRESSED.format(impacted_module_address), data)
 
     async def async_config_entry_updated(self, entry: ConfigEntry) -> None:
         """Handle updates to the configuration entry."""
@@ -1,6 +1,8 @@
 import logging
 import asyncio
 import time
+from datetime import timedelta
+from functools import partial
 from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
@@ -8,9 +10,12 @@ from homeassistant.components.cover import (
     ATTR_POSITION,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.restore_state import RestoreEntity
-from .const import DOMAIN, BRAND
+from .const import DOMAIN, BRAND, CHANNEL_NOT_IN_USE, COVER_DELAY_BEFORE_STOP, SIGNAL_BUTTON_PRESSED, SIGNAL_MODULE_REFRESHED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,12 +23,15 @@ STATE_STOPPED = 0x00
 STATE_OPENING = 0x01
 STATE_CLOSING = 0x02
 FULL_OPERATION_BUFFER = 3
+DEFAULT_OPERATION_TIME = 30
+POSITION_UPDATE_INTERVAL = timedelta(seconds=1)
 
 class PositionEstimator:
     """Estimates the current position of the cover based on elapsed time and direction."""
 
     def __init__(self, duration_in_seconds):
         self._duration_in_seconds = duration_in_seconds
+        self._percent_per_sec = 100.0 / duration_in_seconds
         self._start_time = None
         self._direction = None
         self.position = None
@@ -42,8 +50,8 @@ class PositionEstimator:
             return None
 
         elapsed_time = time.monotonic() - self._start_time
-        progress = (elapsed_time / self._duration_in_seconds) * 100 * self._direction
-        new_position = max(0, min(100, self.position + progress))
+        new_position = self.position + elapsed_time * self._percent_per_sec * self._direction
+        new_position = 0 if new_position < 0 else 100 if new_position > 100 else new_position
 
         _LOGGER.debug("Position calculated to: %s based on elapsed time: %s seconds", new_position, elapsed_time)
         return int(new_position)
@@ -61,12 +69,42 @@ class PositionEstimator:
         """Publicly expose the duration_in_seconds attribute."""
         return self._duration_in_seconds
 
+class CoverMovementTracker:
+    """Refreshes the state of all moving covers from a single shared interval timer."""
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._covers = set()
+        self._unsub_interval = None
+
+    @callback
+    def add(self, cover):
+        """Start refreshing the given cover, arming the shared timer if needed."""
+        self._covers.add(cover)
+        if self._unsub_interval is None:
+            self._unsub_interval = async_track_time_interval(self._hass, self._refresh, POSITION_UPDATE_INTERVAL)
+
+    @callback
+    def remove(self, cover):
+        """Stop refreshing the given cover, releasing the shared timer when none is moving."""
+        self._covers.discard(cover)
+        if not self._covers and self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+
+    @callback
+    def _refresh(self, _now):
+        """Write the estimated position of every moving cover."""
+        for cover in self._covers:
+            cover.async_write_ha_state()
+
 async def async_setup_entry(hass, entry, async_add_entities) -> bool:
     dataservice = hass.data[DOMAIN].get(entry.entry_id)
+    movement_tracker = CoverMovementTracker(hass)
 
     roller_modules = dataservice.api.dict_module_data.get('roller_module', {})
 
-    entities = [
+    async_add_entities(
         NikobusCoverEntity(
             hass,
             dataservice,
@@ -76,18 +114,17 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
             i,
             channel["description"],
             channel.get("operation_time", "30"),
+            movement_tracker,
         )
         for address, cover_module_data in roller_modules.items()
         for i, channel in enumerate(cover_module_data.get("channels", []), start=1)
-        if not channel["description"].startswith("not_in_use")
-    ]
-
-    async_add_entities(entities)
+        if not channel["description"].startswith(CHANNEL_NOT_IN_USE)
+    )
 
 class NikobusCoverEntity(CoordinatorEntity, CoverEntity, RestoreEntity):
     """Represents a Nikobus cover entity within Home Assistant."""
 
-    def __init__(self, hass: HomeAssistant, dataservice, description, model, address, channel, channel_description, operation_time) -> None:
+    def __init__(self, hass: HomeAssistant, dataservice, description, model, address, channel, channel_description, operation_time, movement_tracker) -> None:
         """Initialize the cover entity with data from the Nikobus system configuration."""
         super().__init__(dataservice)
         self.hass = hass
@@ -99,31 +136,40 @@ class NikobusCoverEntity(CoordinatorEntity, CoverEntity, RestoreEntity):
         self._direction = None
         self._previous_state = None
 
-        self._operation_time = float(operation_time) if operation_time else None
-        self._position_estimator = PositionEstimator(duration_in_seconds=float(operation_time))
+        try:
+            self._operation_time = float(operation_time)
+        except (TypeError, ValueError):
+            self._operation_time = 0
+        # A non-positive duration would break the position estimate, fall back instead of failing the platform
+        if self._operation_time <= 0:
+            _LOGGER.warning("Invalid operation_time %r for cover %s, using %s seconds", operation_time, channel_description, DEFAULT_OPERATION_TIME)
+            self._operation_time = DEFAULT_OPERATION_TIME
+        self._position_estimator = PositionEstimator(duration_in_seconds=self._operation_time)
         self._position = 100
 
-        self._in_motion = False
-        self._movement_task = None
+        # Set while the cover is idle, cleared for the duration of a movement
+        self._movement_done = asyncio.Event()
+        self._movement_done.set()
+        self._movement_tracker = movement_tracker
+        self._target_position = None
+        self._movement_unsub = None
+        # Bumped whenever a movement begins or ends, so a stale completion can tell it was superseded
+        self._movement_generation = 0
 
         self._last_position_change_time = time.monotonic()
 
         self._attr_name = channel_description
         self._attr_unique_id = f"{DOMAIN}_{self._address}_{self._channel}"
         self._attr_device_class = CoverDeviceClass.SHUTTER
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, address)},
+            name=description,
+            manufacturer=BRAND,
+            model=model,
+        )
 
         _LOGGER.debug("NikobusCoverEntity initialized for %s (address: %s, channel: %s)", channel_description, address, channel)
 
-    @property
-    def device_info(self):
-        """Provide device information for Home Assistant."""
-        return {
-            "identifiers": {(DOMAIN, self._address)},
-            "name": self._description,
-            "manufacturer": BRAND,
-            "model": self._model,
-        }
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
@@ -134,6 +180,8 @@ class NikobusCoverEntity(CoordinatorEntity, CoverEntity, RestoreEntity):
     @property
     def current_cover_position(self):
         """Return the current position of the cover."""
+        if not self._movement_done.is_set():
+            return self._position_estimator.get_position()
         return self._position
 
     @property
@@ -149,12 +197,12 @@ class NikobusCoverEntity(CoordinatorEntity, CoverEntity, RestoreEntity):
     @property
     def is_opening(self):
         """Return True if the cover is currently opening."""
-        return self._in_motion and self._direction == 'opening'
+        return not self._movement_done.is_set() and self._direction == 'opening'
 
     @property
     def is_closing(self):
         """Return True if the cover is currently closing."""
-        return self._in_motion and self._direction == 'closing'
+        return not self._movement_done.is_set() and self._direction == 'closing'
 
     @property
     def supported_features(self):
@@ -169,6 +217,7 @@ class NikobusCoverEntity(CoordinatorEntity, CoverEntity, RestoreEntity):
     async def async_added_to_hass(self):
         """Register callbacks when entity is added to hass."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._end_motion)
 
         last_state = await self.async_get_last_state()
         if last_state is not None:
@@ -177,12 +226,56 @@ class NikobusCoverEntity(CoordinatorEntity, CoverEntity, RestoreEntity):
                 self._position = float(last_position)
                 _LOGGER.debug("Restored position for %s to %s", self._attr_name, self._position)
 
-        # Initialize previous state from current API state
-        current_state = self._dataservice.api.get_cover_state(self._address, self._channel)
+        # Initialize previous state from the cache filled once by the coordinator's first refresh,
+        # through the same lookup used by the updates below
+        self._previous_state = self._dataservice.api.get_cover_state(self._address, self._channel)
+
+        # Subscribe to button presses impacting this cover's module only
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_BUTTON_PRESSED.format(self._address),
+                self._handle_nikobus_button_event,
+            )
+        )
+        # Subscribe to feedback refreshes of this cover's module only
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_MODULE_REFRESHED.format(self._address),
+                self._handle_module_refresh,
+            )
+        )
+
+    @callback
+    def _handle_nikobus_button_event(self, data):
+        """Track a movement started or stopped by a physical button on this cover's module."""
+        self._sync_motion(self._dataservice.api.get_cover_state(self._address, self._channel))
+
+    @callback
+    def _handle_module_refresh(self):
+        """Track a movement reported by the feedback data of this cover's module."""
+        self._sync_motion(self._dataservice.api.get_cover_state(self._address, self._channel))
+
+    @callback
+    def _sync_motion(self, current_state):
+        """Align the position tracking with the state reported by the module."""
+        if current_state is None or current_state == self._previous_state:
+            return
         self._previous_state = current_state
 
-        # Subscribe to nikobus_button_pressed event
-        self.hass.bus.async_listen('nikobus_button_pressed', self._handle_nikobus_button_event)
+        if current_state == STATE_STOPPED:
+            if not self._movement_done.is_set():
+                self._end_motion()
+        else:
+            direction = 'opening' if current_state == STATE_OPENING else 'closing'
+            if not self._movement_done.is_set() and direction != self._direction:
+                self._end_motion()
+            if self._movement_done.is_set():
+                self._begin_motion(direction)
+
+        _LOGGER.debug("Cover %s reported state: %s", self._attr_name, current_state)
+        self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs):
         """Open the cover."""
@@ -197,31 +290,101 @@ class NikobusCoverEntity(CoordinatorEntity, CoverEntity, RestoreEntity):
     async def async_stop_cover(self, **kwargs):
         """Stop the cover."""
         _LOGGER.debug("Stopping cover %s", self._attr_name)
+        self._cancel_movement()
         await self._dataservice.api.stop_cover(self._address, self._channel, self._direction)
-        self._position_estimator.stop()
-        self._position = self._position_estimator.position
-        self._in_motion = False
-        self._direction = None
+        self._end_motion()
         self.async_write_ha_state()
 
     async def async_set_cover_position(self, **kwargs):
         """Set the cover to a specific position."""
         target_position = kwargs.get(ATTR_POSITION)
-        if target_position is not None:
-            await self._start_movement('closing' if self._position > target_position else 'opening')
-            await self._update_position_to_target(target_position)
+        if target_position is None:
+            return
+        # Stop first so the direction is computed from where the cover is now, not where it started
+        if not self._movement_done.is_set():
+            await self.async_stop_cover()
+        if target_position != self._position:
+            await self._start_movement('closing' if self._position > target_position else 'opening', target_position)
 
-    async def _start_movement(self, direction):
-        """Start movement in the specified direction."""
-        if self._in_motion:
+    async def _start_movement(self, direction, target_position=None):
+        """Start movement in the specified direction and schedule its completion."""
+        if not self._movement_done.is_set():
             await self.async_stop_cover()
 
+        if target_position is None:
+            target_position = 100 if direction == 'opening' else 0
+
+        self._target_position = target_position
+        self._begin_motion(direction)
+        generation = self._movement_generation
+        try:
+            await self._operate_cover()
+        except BaseException:
+            # The cover never started moving, do not leave it tracked as moving
+            if generation == self._movement_generation:
+                self._end_motion()
+                self.async_write_ha_state()
+            raise
+
+        # The movement was stopped or replaced while the command was in flight
+        if generation != self._movement_generation:
+            return
+
+        # A single callback at the estimated arrival time replaces polling the position
+        remaining_seconds = abs(target_position - self._position) / 100 * self._position_estimator.duration_in_seconds
+        if target_position in (0, 100):
+            remaining_seconds += COVER_DELAY_BEFORE_STOP
+        self._movement_unsub = async_call_later(self.hass, remaining_seconds, partial(self._on_movement_complete, generation))
+        self.async_write_ha_state()
+
+    async def _on_movement_complete(self, generation, _now):
+        """Stop the cover once the target position of the given movement has been reached."""
+        if generation != self._movement_generation:
+            return
+        self._movement_unsub = None
+        _LOGGER.debug("Cover %s reached target position %s", self._attr_name, self._target_position)
+        try:
+            await self._dataservice.api.stop_cover(self._address, self._channel, self._direction)
+        except BaseException:
+            if generation == self._movement_generation:
+                self._end_motion()
+                self.async_write_ha_state()
+            raise
+        # A movement started or stopped while the stop command was in flight owns the cover now
+        if generation != self._movement_generation:
+            return
+        self._end_motion(self._target_position)
+        self.async_write_ha_state()
+
+    @callback
+    def _begin_motion(self, direction):
+        """Start estimating the position while the cover moves in the given direction."""
+        self._movement_generation += 1
         self._direction = direction
-        self._in_motion = True
+        self._movement_done.clear()
         self._position_estimator.start(direction, self._position)
-        await self._operate_cover()
-        if not self._movement_task or self._movement_task.done():
-            self._movement_task = self.hass.async_create_task(self._update_position_in_real_time())
+        self._movement_tracker.add(self)
+
+    @callback
+    def _end_motion(self, position=None):
+        """Finalize the movement at the given or estimated position."""
+        self._movement_generation += 1
+        self._cancel_movement()
+        self._position_estimator.stop()
+        if position is None:
+            position = self._position_estimator.position
+        if position is not None:
+            self._position = position
+        self._direction = None
+        self._movement_done.set()
+        self._movement_tracker.remove(self)
+
+    @callback
+    def _cancel_movement(self):
+        """Cancel the scheduled end of movement, if any."""
+        if self._movement_unsub is not None:
+            self._movement_unsub()
+            self._movement_unsub = None
 
     async def _operate_cover(self):
         """Send the command to operate the cover."""
@@ -3,8 +3,10 @@
 import logging
 from homeassistant.components.light import LightEntity
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN, BRAND
+from .const import DOMAIN, BRAND, CHANNEL_NOT_IN_USE, SIGNAL_BUTTON_PRESSED, SIGNAL_MODULE_REFRESHED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,7 +30,7 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
         )
         for address, dimmer_module_data in dimmer_modules.items() 
         for i, channel in enumerate(dimmer_module_data.get("channels", []), start=1)
-        if not channel["description"].startswith("not_in_use")
+        if not channel["description"].startswith(CHANNEL_NOT_IN_USE)
     ]
 
     async_add_entities(entities)
@@ -49,16 +51,12 @@ class NikobusLightEntity(CoordinatorEntity, LightEntity):
 
         self._attr_name = channel_description
         self._attr_unique_id = f"{DOMAIN}_{self._address}_{self._channel}"
-
-    @property
-    def device_info(self):
-        """Return device information about this light."""
-        return {
-            "identifiers": {(DOMAIN, self._address)},
-            "name": self._description,
-            "manufacturer": BRAND,
-            "model": self._model,
-        }
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, address)},
+            name=description,
+            manufacturer=BRAND,
+            model=model,
+        )
 
     @property
     def brightness(self):
@@ -80,6 +78,31 @@ class NikobusLightEntity(CoordinatorEntity, LightEntity):
         """Return True if the light is on."""
         return self._state or False
 
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks when entity is added to hass."""
+        await super().async_added_to_hass()
+        # Subscribe to button presses impacting this entity's module only
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_BUTTON_PRESSED.format(self._address),
+                self._handle_nikobus_button_event,
+            )
+        )
+        # Subscribe to feedback refreshes of this entity's module only
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_MODULE_REFRESHED.format(self._address),
+                self._handle_coordinator_update,
+            )
+        )
+
+    @callback
+    def _handle_nikobus_button_event(self, data) -> None:
+        """Re-read the state after a physical button press on this light's module."""
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -2,12 +2,15 @@
 
 import asyncio
 import logging
+from binascii import unhexlify
 
 from nikobusconnect import NikobusConnect, NikobusConnectionError, NikobusDataError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import DOMAIN, DIMMER_DELAY
+from .const import DOMAIN, DIMMER_DELAY, OUTPUT_COMMAND_QUEUE_SIZE, REFRESH_MAX_CONCURRENT_QUERIES, SIGNAL_MODULE_REFRESHED
 from .nkbconfig import NikobusConfig
 from .nkblistener import NikobusEventListener
 from .nkbcommand import NikobusCommandHandler
@@ -28,10 +31,24 @@ class Nikobus:
         self.dict_button_data = {}
         self.dict_scene_data = {}
 
+        # Output commands are sent one at a time by a single worker, bounded to apply back-pressure
+        self._output_command_queue = asyncio.Queue(maxsize=OUTPUT_COMMAND_QUEUE_SIZE)
+        self._output_command_worker = None
+        self._closed = False
+        # Refresh reads do not go through the output command queue: up to this many group state
+        # queries run concurrently against the command handler, across all module types
+        self._refresh_semaphore = asyncio.Semaphore(REFRESH_MAX_CONCURRENT_QUERIES)
+
+        # Coalesce button configuration writes when many buttons are discovered in a burst
+        self._button_write_debouncer = Debouncer(
+            hass, _LOGGER, cooldown=2.0, immediate=False, function=self._flush_buttons
+        )
+        self._buttons_pending_write = False
+
     @classmethod
     async def create(cls, hass, config_entry, connection_string, async_event_handler):
         """Create a new instance of Nikobus and establish a connection."""
-        _LOGGER.debug(f"Creating Nikobus instance with connection string: {connection_string}")
+        _LOGGER.debug("Creating Nikobus instance with connection string: %s", connection_string)
         instance = cls(hass, config_entry, connection_string, async_event_handler)
         if await instance.connect():
             _LOGGER.info("Nikobus instance created and connected successfully")
@@ -43,10 +60,12 @@ class Nikobus:
         """Connect to the Nikobus system and load module data."""
         if await self._nikobus_connection.connect():
             try:
-                # Load module, button, and scene configuration data
-                self.dict_module_data = await self._nikobus_config.load_json_data("nikobus_module_config.json", "module")
-                self.dict_button_data = await self._nikobus_config.load_json_data("nikobus_button_config.json", "button")
-                self.dict_scene_data = await self._nikobus_config.load_json_data("nikobus_scene_config.json", "scene")
+                # Load module, button, and scene configuration data concurrently
+                self.dict_module_data, self.dict_button_data, self.dict_scene_data = await asyncio.gather(
+                    self._nikobus_config.load_json_data("nikobus_module_config.json", "module"),
+                    self._nikobus_config.load_json_data("nikobus_button_config.json", "button"),
+                    self._nikobus_config.load_json_data("nikobus_scene_config.json", "scene"),
+                )
                 return True
             except HomeAssistantError as e:
                 raise HomeAssistantError(f'An error occurred loading configuration files: {e}')
@@ -58,86 +77,195 @@ class Nikobus:
 
     async def command_handler(self):
         """Start processing Nikobus commands."""
+        self._output_command_worker = self._hass.async_create_task(self._process_output_commands())
         await self.nikobus_command_handler.start()
 
+    async def async_shutdown(self) -> None:
+        """Stop the output command worker, fail the commands still waiting for it and write pending buttons."""
+        self._closed = True
+        if self._output_command_worker is not None:
+            self._output_command_worker.cancel()
+            self._output_command_worker = None
+        while not self._output_command_queue.empty():
+            *_, future = self._output_command_queue.get_nowait()
+            self._output_command_queue.task_done()
+            if not future.done():
+                future.set_exception(NikobusConnectError("Nikobus connection closed"))
+
+        # Write the buttons discovered during the last cooldown instead of dropping them
+        self._button_write_debouncer.async_shutdown()
+        if self._buttons_pending_write:
+            try:
+                await self._flush_buttons()
+            except HomeAssistantError as e:
+                _LOGGER.error("Failed to write discovered buttons on shutdown: %s", e)
+
+    async def _process_output_commands(self) -> None:
+        """Send the queued output state commands in order."""
+        while True:
+            address, channel, value, future = await self._output_command_queue.get()
+            try:
+                await self.nikobus_command_handler.set_output_state(address, channel, value)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.set_exception(NikobusConnectError("Nikobus connection closed"))
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(None)
+            finally:
+                self._output_command_queue.task_done()
+
+    async def _set_output_state(self, address: str, channel: int, value: int) -> None:
+        """Queue an output state command and wait until it has been sent."""
+        if self._closed:
+            raise NikobusConnectError("Nikobus connection closed")
+        future = self._hass.loop.create_future()
+        await self._output_command_queue.put((address, channel, value, future))
+        # The queue may have been drained by a shutdown while waiting for a free slot
+        if self._closed and not future.done():
+            raise NikobusConnectError("Nikobus connection closed")
+        await future
+
     async def refresh_nikobus_data(self) -> bool:
         """Refresh data for different module types in Nikobus."""
-        for module_type in ['switch_module', 'dimmer_module', 'roller_module']:
-            modules = self.dict_module_data.get(module_type)
-            if modules:
-                await self._refresh_module_type(modules)
+        await asyncio.gather(*(
+            self._refresh_module_type(modules)
+            for module_type in ['switch_module', 'dimmer_module', 'roller_module']
+            if (modules := self.dict_module_data.get(module_type))
+        ))
         return True
 
     async def _refresh_module_type(self, modules_dict):
         """Refresh data for a given type of Nikobus module."""
-        for address, module_data in modules_dict.items():
-            _LOGGER.debug(f'Refreshing data for module address: {address}')
-            state = ""
-            channel_count = len(module_data.get("channels", []))
-            groups_to_query = [1] if channel_count <= 6 else [1, 2]
+        queries = [
+            (address, group)
+            for address, module_data in modules_dict.items()
+            for group in ([1] if len(module_data.get("channels", [])) <= 6 else [1, 2])
+        ]
+        # Issue the group queries concurrently, the refresh semaphore bounds how many are in flight
+        results = await asyncio.gather(*(
+            self._get_group_state(address, group)
+            for address, group in queries
+        ))
 
-            for group in groups_to_query:
-                group_state = await self.nikobus_command_handler.get_output_state(address, group) or ""
-                _LOGGER.debug(f'State for group {group}: {group_state} address: {address}')
-                state += group_state
+        module_states = {}
+        for (address, group), group_state in zip(queries, results):
+            _LOGGER.debug('State for group %s: %s address: %s', group, group_state, address)
+            module_states[address] = module_states.get(address, "") + (group_state or "")
 
+        for address, state in module_states.items():
             self.nikobus_command_handler.set_bytearray_group_state(address, state)
 
+    async def _get_group_state(self, address: str, group: int):
+        """Query the output state of a module group, a few queries at a time."""
+        async with self._refresh_semaphore:
+            return await self.nikobus_command_handler.get_output_state(address, group)
+
+    def get_all_cover_states(self) -> dict:
+        """Return the cached state of every roller channel, keyed by (address, channel)."""
+        return self._get_channel_states('roller_module')
+
+    def get_all_switch_states(self) -> dict:
+        """Return the cached on/off state of every switch channel, keyed by (address, channel)."""
+        return {key: bool(state) for key, state in self._get_channel_states('switch_module').items()}
+
+    def get_all_light_states(self) -> dict:
+        """Return the cached brightness of every dimmer channel, keyed by (address, channel)."""
+        return self._get_channel_states('dimmer_module')
+
+    def get_cover_state(self, address: str, channel: int):
+        """Return the cached state of a roller channel, or None before its module was read."""
+        return self._get_channel_state(address, channel)
+
+    def get_switch_state(self, address: str, channel: int):
+        """Return the cached on/off state of a switch channel, or None before its module was read."""
+        state = self._get_channel_state(address, channel)
+        return None if state is None else bool(state)
+
+    def _get_channel_states(self, module_type: str) -> dict:
+        """Return the cached output state of every channel of a module type, keyed by (address, channel)."""
+        return {
+            (address, channel): state
+            for address, module_data in self.dict_module_data.get(module_type, {}).items()
+            for channel in range(1, len(module_data.get("channels", [])) + 1)
+            if (state := self._get_channel_state(address, channel)) is not None
+        }
+
+    def _get_channel_state(self, address: str, channel: int):
+        """Look up the cached output state of a channel, the single source for every state read."""
+        module_state = self.nikobus_command_handler._module_states.get(address)
+        return None if module_state is None else module_state[channel - 1]
+
     async def process_feedback_data(self, module_group, data):
         """Process feedback data from Nikobus."""
         try:
-            module_address_raw = data[3:7]
-            module_address = module_address_raw[2:] + module_address_raw[:2]
+            # The module address is sent low byte first
+            module_address = f"{data[5:7]}{data[3:5]}"
             module_state_raw = data[9:21]
 
-            if module_address not in self.nikobus_command_handler._module_states:
-                self.nikobus_command_handler._module_states[module_address] = bytearray(12)
+            states = self.nikobus_command_handler._module_states
+            module_state = states.get(module_address)
+            if module_state is None:
+                module_state = states[module_address] = bytearray(12)
 
+            # Decode straight into the module state, without an intermediate bytearray
             if module_group == 1:
-                self.nikobus_command_handler._module_states[module_address][:6] = bytearray.fromhex(module_state_raw)
+                module_state[:6] = unhexlify(module_state_raw)
             elif module_group == 2:
-                self.nikobus_command_handler._module_states[module_address][6:] = bytearray.fromhex(module_state_raw)
+                module_state[6:] = unhexlify(module_state_raw)
 
-            await self._async_event_handler("nikobus_refreshed", {
-                'impacted_module_address': module_address
-            })
+            # Only the entities of this module need to re-read their state
+            async_dispatcher_send(self._hass, SIGNAL_MODULE_REFRESHED.format(module_address))
 
         except Exception as e:
-            _LOGGER.error(f"Error processing feedback data: {e}", exc_info=True)
+            _LOGGER.error("Error processing feedback data: %s", e, exc_info=True)
 
     async def button_discovery(self, address: str) -> None:
         """Discover button information and add to configuration if new."""
-        _LOGGER.debug(f"Discovering button at address: {address}.")
+        _LOGGER.debug("Discovering button at address: %s.", address)
         if "nikobus_button" not in self.dict_button_data:
             self.dict_button_data["nikobus_button"] = {}
 
         if address not in self.dict_button_data["nikobus_button"]:
-            self.dict_button_data["nikobus_button"][address] = {
+            button = {
                 "description": f"DISCOVERED - Nikobus Button #N{address}",
                 "address": address,
                 "impacted_module": [{"address": "", "group": ""}]
             }
-            await self._nikobus_config.write_json_data("nikobus_button_config.json", "button", self.dict_button_data)
+            self.dict_button_data["nikobus_button"][address] = button
+            self._nikobus_config.add_button(button)
+            self._buttons_pending_write = True
+            if not self._closed:
+                await self._button_write_debouncer.async_call()
+
+    async def _flush_buttons(self) -> None:
+        """Write the discovered buttons to the button configuration file."""
+        self._buttons_pending_write = False
+        await self._nikobus_config.write_button_data("nikobus_button_config.json")
 
     async def turn_on_light(self, address: str, channel: int, brightness: int) -> None:
         """Turn on a light at the given brightness level."""
-        await self.nikobus_command_handler.set_output_state(address, channel, brightness)
+        await self._set_output_state(address, channel, brightness)
 
     async def turn_off_light(self, address: str, channel: int) -> None:
         """Turn off a light by setting brightness to 0."""
-        await self.nikobus_command_handler.set_output_state(address, channel, 0)
+        await self._set_output_state(address, channel, 0)
 
     async def open_cover(self, address: str, channel: int) -> None:
         """Open a cover."""
-        await self.nikobus_command_handler.set_output_state(address, channel, 0x01)
+        await self._set_output_state(address, channel, 0x01)
 
     async def close_cover(self, address: str, channel: int) -> None:
         """Close a cover."""
-        await self.nikobus_command_handler.set_output_state(address, channel, 0x02)
+        await self._set_output_state(address, channel, 0x02)
 
     async def stop_cover(self, address: str, channel: int, direction: str) -> None:
         """Stop a cover in motion."""
-        await self.nikobus_command_handler.set_output_state(address, channel, 0x00)
+        await self._set_output_state(address, channel, 0x00)
 
 class NikobusConnectError(HomeAssistantError):
     """Custom exception for handling Nikobus connection errors."""
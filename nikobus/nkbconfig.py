@@ -1,7 +1,7 @@
 """Load / Write configuration files for Nikobus"""
 
-import json
 import logging
+import orjson
 from aiofiles import open as aio_open
 from homeassistant.exceptions import HomeAssistantError
 
@@ -13,19 +13,21 @@ class NikobusConfig:
     def __init__(self, hass):
         """Initialize the configuration handler."""
         self._hass = hass
+        # Buttons in file order; entries are shared with the loaded dictionary and written as is
+        self._button_list = []
 
     async def load_json_data(self, file_name: str, data_type: str) -> dict | None:
         """Load JSON data from a file and transform it based on the data type."""
         file_path = self._hass.config.path(file_name)
         _LOGGER.info(f'Loading {data_type} data from {file_path}')
         try:
-            async with aio_open(file_path, mode='r') as file:
-                data = json.loads(await file.read())
+            async with aio_open(file_path, mode='rb') as file:
+                data = orjson.loads(await file.read())
             return self._transform_loaded_data(data, data_type)
 
         except FileNotFoundError:
             self._handle_file_not_found(file_path, data_type)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             _LOGGER.error(f'Failed to decode JSON in {data_type} file: {e}')
             raise HomeAssistantError(f'Failed to decode JSON in {data_type} file: {e}') from e
         except Exception as e:
@@ -42,8 +44,9 @@ class NikobusConfig:
         return data
 
     def _transform_button_data(self, data: dict) -> dict:
-        """Transform button data from a list to a dictionary."""
-        data['nikobus_button'] = {button['address']: button for button in data.get('nikobus_button', [])}
+        """Transform button data from a list to a dictionary, keeping the list for writing."""
+        self._button_list = data.get('nikobus_button', [])
+        data['nikobus_button'] = {button['address']: button for button in self._button_list}
         return data
 
     def _transform_module_data(self, data: dict) -> dict:
@@ -59,13 +62,21 @@ class NikobusConfig:
         else:
             raise HomeAssistantError(f'{data_type.capitalize()} configuration file not found: {file_path}')
 
+    def add_button(self, button: dict) -> None:
+        """Append a newly discovered button to the list written to the button file."""
+        self._button_list.append(button)
+
+    async def write_button_data(self, file_name: str) -> None:
+        """Write the loaded and discovered buttons to a JSON file, in file order."""
+        await self.write_json_data(file_name, "button", {"nikobus_button": self._button_list})
+
     async def write_json_data(self, file_name: str, data_type: str, data: dict) -> None:
         """Write data to a JSON file, transforming it into a list format if necessary."""
         file_path = self._hass.config.path(file_name)
         try:
             transformed_data = self._transform_data_for_writing(data_type, data)
-            async with aio_open(file_path, 'w') as file:
-                json_data = json.dumps(transformed_data, indent=4)
+            async with aio_open(file_path, 'wb') as file:
+                json_data = orjson.dumps(transformed_data, option=orjson.OPT_INDENT_2)
                 await file.write(json_data)
 
         except (IOError, TypeError) as e:
@@ -77,18 +88,4 @@ class NikobusConfig:
 
     def _transform_data_for_writing(self, data_type: str, data: dict) -> dict:
         """Transform the data for writing based on the data type."""
-        if data_type == "button":
-            return self._transform_button_data_for_writing(data)
         return data
-
-    def _transform_button_data_for_writing(self, data: dict) -> dict:
-        """Transform button data from a dictionary back to a list for saving."""
-        button_data_list = [
-            {
-                "description": details["description"],
-                "address": address,
-                "impacted_module": details["impacted_module"]
-            }
-            for address, details in data.get("nikobus_button", {}).items()
-        ]
-        return {"nikobus_button": button_data_list}
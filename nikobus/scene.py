@@ -1,9 +1,11 @@
+import asyncio
 import logging
 from homeassistant.components.scene import Scene
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN, BRAND
-from nikobusconnect import NikobusScene
+from nikobusconnect import NikobusScene, NikobusConnectionError, NikobusDataError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,49 +16,44 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> b
     dataservice = hass.data[DOMAIN].get(entry.entry_id)
     api = dataservice.api
     scene_data = api.get_scene_data()  # Assume this method exists in the library
+    # Scene activations of this entry are sent one at a time instead of racing on the bus
+    activation_lock = asyncio.Lock()
 
     entities = [
-        NikobusSceneEntity(hass, api, scene['description'], scene['id'], scene['channels'])
+        NikobusSceneEntity(api, activation_lock, scene['description'], scene['id'], scene['channels'])
         for scene in scene_data
     ]
 
-    _LOGGER.debug(f"Adding {len(entities)} Nikobus scene entities.")
+    _LOGGER.debug("Adding %s Nikobus scene entities.", len(entities))
     async_add_entities(entities)
 
 class NikobusSceneEntity(Scene):
-    def __init__(self, hass, api, description, scene_id, channels):
+    __slots__ = ("_api", "_activation_lock", "_description", "_scene_id", "_channels")
+
+    def __init__(self, api, activation_lock, description, scene_id, channels):
         """Initialize Nikobus Scene Entity."""
-        self._hass = hass
         self._api = api
+        self._activation_lock = activation_lock
         self._description = description
         self._scene_id = scene_id
         self._channels = channels
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"nikobus_scene_{self._scene_id}"
-
-    @property
-    def device_info(self):
-        """Link the scene to the Nikobus integration."""
-        return {
-            "identifiers": {(DOMAIN, self._scene_id)},
-            "name": self._description,
-            "manufacturer": BRAND,
-            "model": "Scene",
-        }
-
-    @property
-    def name(self) -> str:
-        """Return the name of the scene."""
-        return self._description
+        self._attr_name = description
+        self._attr_unique_id = f"nikobus_scene_{scene_id}"
+        # Link the scene to the Nikobus integration
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, scene_id)},
+            name=description,
+            manufacturer=BRAND,
+            model="Scene",
+        )
 
     async def async_activate(self) -> None:
         """Activate the scene using nikobusconnect's scene activation."""
         try:
-            _LOGGER.debug(f"Activating scene {self._description} with ID {self._scene_id}")
-            await self._api.activate_scene(self._scene_id)  # Assuming activate_scene is in the library
-            _LOGGER.info(f"Scene '{self._description}' activated.")
-        except Exception as e:
-            _LOGGER.error(f"Failed to activate scene '{self._description}': {e}")
+            _LOGGER.debug("Activating scene %s with ID %s", self._description, self._scene_id)
+            async with self._activation_lock:
+                await self._api.activate_scene(self._scene_id)  # Assuming activate_scene is in the library
+            _LOGGER.info("Scene '%s' activated.", self._description)
+        except (NikobusConnectionError, NikobusDataError, OSError) as e:
+            _LOGGER.error("Failed to activate scene '%s': %s", self._description, e)
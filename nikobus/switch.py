@@ -1,8 +1,13 @@
+import asyncio
 import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN, BRAND
+from nikobusconnect import NikobusConnectionError, NikobusDataError
+from .const import DOMAIN, BRAND, SIGNAL_BUTTON_PRESSED, SIGNAL_MODULE_REFRESHED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -11,79 +16,136 @@ async def async_setup_entry(hass, entry, async_add_entities) -> bool:
     dataservice = hass.data[DOMAIN].get(entry.entry_id)
     api = dataservice.api  # Use the API provided by the PyPI library
 
-    switch_modules = api.get_module_data('switch_module')  # Assuming this method exists
-
-    entities = [
-        NikobusSwitchEntity(
-            hass,
-            api,
-            switch_data.get("description"),
-            switch_data.get("model"),
-            address,
-            i,
-            channel.get("description")
-        )
-        for address, switch_data in switch_modules.items()
-        for i, channel in enumerate(switch_data.get("channels", []), start=1)
-        if not channel.get("description", "").startswith("not_in_use")
-    ]
-
-    async_add_entities(entities)
+    # The coordinator walks the switch module configuration once per connection
+    async_add_entities(NikobusSwitchEntity(hass, api, dataservice, *row) for row in dataservice.switch_channels)
 
 
 class NikobusSwitchEntity(CoordinatorEntity, SwitchEntity):
     """Represents a Nikobus switch entity within Home Assistant."""
 
-    def __init__(self, hass: HomeAssistant, api, description, model, address, channel, channel_description) -> None:
+    __slots__ = (
+        "_api", "_state", "_description", "_model", "_address", "_channel", "_pending", "_request_count", "_send_lock",
+    )
+
+    def __init__(self, hass: HomeAssistant, api, coordinator, description, model, address, channel, channel_description) -> None:
         """Initialize the switch entity with data from the Nikobus system configuration."""
-        super().__init__(dataservice)
+        super().__init__(coordinator)
         self._api = api
-        self._state = None
+        self._state = False
         self._description = description
         self._model = model
         self._address = address
         self._channel = channel
 
+        # Rapid toggles only send the latest requested state to the bus
+        self._pending = None
+        self._request_count = 0
+        self._send_lock = asyncio.Lock()
+
         self._attr_name = channel_description
         self._attr_unique_id = f"{DOMAIN}_{self._address}_{self._channel}"
-
-    @property
-    def device_info(self):
-        """Return device information about this switch."""
-        return {
-            "identifiers": {(DOMAIN, self._address)},
-            "name": self._description,
-            "manufacturer": BRAND,
-            "model": self._model,
-        }
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, address)},
+            name=description,
+            manufacturer=BRAND,
+            model=model,
+        )
 
     @property
     def is_on(self):
         """Return True if the switch is on."""
-        return self._state or False
+        return self._state
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks when entity is added to hass."""
+        await super().async_added_to_hass()
+        # Subscribe to button presses impacting this entity's module only
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_BUTTON_PRESSED.format(self._address),
+                self._handle_nikobus_button_event,
+            )
+        )
+        # Subscribe to feedback refreshes of this entity's module only
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_MODULE_REFRESHED.format(self._address),
+                self._handle_module_refresh,
+            )
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._state = self._api.get_switch_state(self._address, self._channel)
+        self._update_state(self._api.get_switch_state(self._address, self._channel))
+
+    @callback
+    def _handle_nikobus_button_event(self, data) -> None:
+        """Re-read the state after a physical button press on this switch's module."""
+        self._handle_module_refresh()
+
+    @callback
+    def _handle_module_refresh(self) -> None:
+        """Handle feedback data refreshing this switch's module."""
+        self._update_state(self._api.get_switch_state(self._address, self._channel))
+
+    @callback
+    def _update_state(self, new_state) -> None:
+        """Store the new state and write it when it changed."""
+        new_state = bool(new_state)
+        # Skip the state write when the switch did not change
+        if new_state == self._state:
+            return
+        self._state = new_state
         self.async_write_ha_state()
 
     async def async_turn_on(self):
         """Turn the switch on."""
-        try:
-            await self._api.turn_on_switch(self._address, self._channel)
-            self._state = True
-        except Exception as e:
-            _LOGGER.error(f"Failed to turn on switch at address {self._address}, channel {self._channel}: {e}")
-            self._state = False  # Reset state if there was an error
-        self.async_write_ha_state()
+        self._set_pending(True)
+        await self._send_pending()
 
     async def async_turn_off(self):
         """Turn the switch off."""
-        try:
-            await self._api.turn_off_switch(self._address, self._channel)
-            self._state = False
-        except Exception as e:
-            _LOGGER.error(f"Failed to turn off switch at address {self._address}, channel {self._channel}: {e}")
-            self._state = True  # Reset state if there was an error
+        self._set_pending(False)
+        await self._send_pending()
+
+    @callback
+    def _set_pending(self, state):
+        """Record the requested state and show it right away."""
+        self._pending = state
+        self._state = state
         self.async_write_ha_state()
+
+    async def _send_pending(self):
+        """Send the latest requested state once the command in flight has completed."""
+        self._request_count += 1
+        request = self._request_count
+        async with self._send_lock:
+            # A newer request is waiting behind this one and will send the latest state
+            if request != self._request_count:
+                return
+            await self._send_state(self._pending, request)
+
+    async def _send_state(self, state, request):
+        """Send a state to the switch."""
+        try:
+            if state:
+                await self._api.turn_on_switch(self._address, self._channel)
+            else:
+                await self._api.turn_off_switch(self._address, self._channel)
+        except (NikobusConnectionError, NikobusDataError, HomeAssistantError, OSError) as e:
+            _LOGGER.error("Failed to turn %s switch at address %s, channel %s: %s", "on" if state else "off", self._address, self._channel, e)
+            self._revert_state(state, request)
+        except BaseException:
+            # The optimistic state must never outlive a command that did not complete
+            self._revert_state(state, request)
+            raise
+
+    @callback
+    def _revert_state(self, state, request):
+        """Reset the optimistic state after a failed command, unless a newer request is already queued."""
+        if request == self._request_count:
+            self._state = not state
+            self.async_write_ha_state()